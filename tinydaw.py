@@ -1,14 +1,27 @@
 import curses
 import os
+import stat
+import unicodedata
 import time
 import logging
-import random
+import logging.handlers
+import queue
+import threading
+from collections import deque
 from curses import wrapper
 from enum import Enum, auto
 
-# Setup logging
-logging.basicConfig(filename='tinydaw.log', level=logging.DEBUG, 
+# Setup logging: records are queued and written to disk by a listener thread.
+# Set TINYDAW_LOG=DEBUG for per-keystroke tracing.
+log_queue = queue.SimpleQueue()
+log_listener = logging.handlers.QueueListener(log_queue, logging.FileHandler('tinydaw.log'))
+log_level = os.environ.get('TINYDAW_LOG', 'INFO').upper()
+level_known = isinstance(logging.getLevelName(log_level), int) # Name -> number; unknown -> "Level X"
+logging.basicConfig(handlers=[logging.handlers.QueueHandler(log_queue)],
+                    level=log_level if level_known else logging.INFO,
                     format='%(asctime)s - %(levelname)s - %(message)s')
+if not level_known:
+    logging.warning("Unknown TINYDAW_LOG level %r, using INFO", log_level)
 
 # Try importing pygame for audio support
 try:
@@ -19,8 +32,34 @@ except ImportError:
     AUDIO_ENABLED = False
     logging.warning("Pygame not found, audio disabled.")
 
+# Title bar text, fixed once audio support is known
+TITLE_STR = " tinydaw alpha "
+AUDIO_STATUS_STR = "(Audio: ON) " if AUDIO_ENABLED else "(Audio: OFF) "
+FULL_TITLE_STR = TITLE_STR + AUDIO_STATUS_STR
+
 MAX_CHANNELS = 8
 GATE_THRESHOLD = 0.5  # Seconds without input to consider key released
+GATE_THRESHOLD_NS = int(GATE_THRESHOLD * 1e9) # Same, for time.monotonic_ns() comparisons
+GATE_POLL_MS = 50  # getch() timeout while anything is playing and meters are hidden
+FRAME_NS = 1_000_000_000 // 60  # Minimum spacing between screen updates (60Hz cap)
+METER_FRAME_MS = -(-FRAME_NS // 1_000_000)  # getch() timeout while meters animate: one frame, rounded up
+VU_TICK_NS = 10_000_000  # Time step the two meter smoothing coefficients are defined for
+VU_ATTACK = 0.5  # Meter smoothing coefficient per VU_TICK_NS while rising
+VU_DECAY = 0.1  # Meter smoothing coefficient per VU_TICK_NS while falling
+BUSY_POLL_NS = 50_000_000  # Minimum spacing of get_busy() polls per channel (20Hz)
+MAX_TRACKED_VOICES = 8  # Per-channel playing voices kept for the meter; oldest drop off
+
+# Shared "NN%" labels, indexed by integer percent
+PERCENT_LABELS = tuple(f"{p}%" for p in range(101))
+
+# Meter jitter factors in [0.9, 1.0], scrambled by a multiplicative hash; cycled, not random
+JITTER = tuple(0.9 + 0.1 * ((i * 2654435761) & 0xff) / 255 for i in range(256))
+
+# Colour attributes, filled in by init_colors() once curses has started
+ATTR_GREEN = ATTR_YELLOW = ATTR_RED = ATTR_CYAN = ATTR_MAGENTA = ATTR_BLUE = curses.A_NORMAL
+ATTR_GREEN_BOLD = ATTR_YELLOW_BOLD = ATTR_RED_BOLD = curses.A_NORMAL
+ATTR_CYAN_BOLD = ATTR_MAGENTA_BOLD = ATTR_BLUE_BOLD = curses.A_NORMAL
+ATTR_DIM = ATTR_SELECTED = ATTR_SELECTED_BOLD = ATTR_HEADER_UNDERLINE = curses.A_NORMAL
 
 class Mode(Enum):
     VIEW_MIXER = auto()
@@ -35,305 +74,741 @@ class TriggerMode(Enum):
     def __str__(self):
         return self.name
 
+# Per-view heading and footer instructions
+MODE_HEADINGS = {
+    Mode.VIEW_MIXER: "MIXER - Faders (Vol)",
+    Mode.VIEW_METERS: "METERS - dB Levels (Visual)",
+    Mode.CHANNEL_ASSIGN: "ASSIGN - Setup",
+}
+MODE_INSTRUCTIONS = {
+    Mode.VIEW_MIXER: "[Arrow Keys: Mix] [F2: Meters] [F3: Assign] [Q: Quit]",
+    Mode.VIEW_METERS: "[F1: Mixer] [F3: Assign] [Q: Quit]",
+    Mode.CHANNEL_ASSIGN: "[Up/Down: Nav] [F: File] [K: Key] [T: Mode] [F1: Mixer]",
+}
+
+def char_cells(c):
+    """Terminal cells c occupies: 2 for wide/fullwidth, 0 for combining marks, else 1."""
+    if unicodedata.combining(c):
+        return 0
+    return 2 if unicodedata.east_asian_width(c) in ('W', 'F') else 1
+
+def text_cells(text):
+    return sum(map(char_cells, text))
+
+def clip_cells(text, width):
+    """Longest prefix of text that fits in width terminal cells."""
+    used = 0
+    for i, c in enumerate(text):
+        used += char_cells(c)
+        if used > width:
+            return text[:i]
+    return text
+
+def key_label(key):
+    """Short printable label for a keycode: the key itself, ^X for controls, else "?"."""
+    if 32 <= key < 127:
+        return chr(key).upper()
+    try:
+        name = curses.keyname(key).decode('ascii', 'replace')
+    except (ValueError, curses.error):
+        return "?"
+    # Column headers leave room for two cells; "KEY_F(5)" and "M-x" don't fit
+    return name if len(name) <= 2 and name.isprintable() else "?"
+
 class Channel:
-    def __init__(self, index):
+    # Fixed attribute layout: no per-instance __dict__ to walk on every lookup
+    __slots__ = (
+        'index', 'active_gates', 'audio_q',
+        '_cached_header', '_cached_assign_line', '_cached_assign_width',
+        '_cached_handle_pos', '_cached_fader_height',
+        'file_path', 'file_stat', 'assigned_key', '_assigned_char', 'sound',
+        'load_failed', 'load_pending', 'load_error_shown',
+        '_name', '_trigger_mode', '_volume',
+        'pending_trigger', 'last_triggered_ns', 'is_gated_playing',
+        'playing_channels', 'voice_pending', 'busy_polled_ns', 'vu_level', 'vu_updated_ns',
+    )
+
+    _jitter_i = 0 # Shared position in JITTER
+
+    def __init__(self, index, active_gates, audio_q):
         self.index = index
+        # Rendered text, rebuilt only after a displayed field changes
+        self._cached_header = None
+        self._cached_assign_line = None
+        self._cached_assign_width = None
+        self._cached_handle_pos = 0
+        self._cached_fader_height = None
+
+        self.active_gates = active_gates # Shared set of channels with an open gate
+        self.audio_q = audio_q # Commands for audio_worker(); never touch the mixer here
         self.file_path = None
+        self.file_stat = None # (mtime, size, path) of the assigned file
         self.assigned_key = None  # Integer keycode
         self.assigned_char = "-"  # Display char
         self.sound = None
+        self.load_failed = False # Decode of file_path failed; skip it until reassigned
+        self.load_pending = None # Path queued for decode and not yet finished; see next_timeout_ms()
+        self.load_error_shown = False # The UI has flagged load_failed to the user
         self.name = "Empty"
         self.trigger_mode = TriggerMode.ONESHOT
         self.volume = 1.0
         
         # State
-        self.last_triggered_time = 0.0
+        self.pending_trigger = False # Set by trigger(), played by flush_trigger()
+        self.last_triggered_ns = 0 # time.monotonic_ns() of the latest GATE trigger
         self.is_gated_playing = False
-        self.playing_channels = [] # Track pygame channels for visualization
+        self.playing_channels = deque(maxlen=MAX_TRACKED_VOICES) # pygame channels for visualization, appended by audio_worker
+        self.voice_pending = False # Play queued but not yet in playing_channels
+        self.busy_polled_ns = 0 # When update() last asked pygame which voices are busy
         self.vu_level = 0.0 # 0.0 to 1.0
+        self.vu_updated_ns = 0 # now_ns of the last update(), for time-scaled smoothing
+
+    def _invalidate_display(self):
+        self._cached_header = None
+        self._cached_assign_line = None
+
+    @property
+    def assigned_char(self):
+        return self._assigned_char
+
+    @assigned_char.setter
+    def assigned_char(self, value):
+        self._assigned_char = value
+        self._invalidate_display()
+
+    @property
+    def name(self):
+        return self._name
+
+    @name.setter
+    def name(self, value):
+        self._name = value
+        self._invalidate_display()
+
+    @property
+    def trigger_mode(self):
+        return self._trigger_mode
+
+    @trigger_mode.setter
+    def trigger_mode(self, value):
+        self._trigger_mode = value
+        self._invalidate_display()
+
+    @property
+    def volume(self):
+        return self._volume
+
+    @volume.setter
+    def volume(self, value):
+        self._volume = value
+        self._cached_fader_height = None
+        self._invalidate_display()
+
+    @property
+    def shown_name(self):
+        """name, prefixed with "!" once a failed decode has been reported."""
+        return "!" + self._name if self.load_error_shown else self._name
+
+    def show_load_failure(self):
+        """On the UI thread: mark the failed decode and return the status text for it."""
+        self.load_error_shown = True
+        self._invalidate_display()
+        return f"CH{self.index+1}: can't decode {self.name}"
+
+    def render_view_header(self):
+        """(channel label, key label) for the mixer/meter column headers."""
+        if self._cached_header is None:
+            self._cached_header = (f"CH{self.index+1}", f"[{self.assigned_char}]")
+        return self._cached_header
+
+    def fader_handle_pos(self, height):
+        """Fader handle row (0 = bottom), recomputed on volume or height change."""
+        if self._cached_fader_height != height:
+            self._cached_handle_pos = int(self.volume * (height - 1))
+            self._cached_fader_height = height
+        return self._cached_handle_pos
+
+    def render_assign_line(self, width):
+        """Assign-view row text (without the selection prefix), cut to width."""
+        if self._cached_assign_line is None or self._cached_assign_width != width:
+            line = f"CH{self.index+1}: [{self.assigned_char}] Vol={PERCENT_LABELS[int(self.volume*100)]} {self.trigger_mode.name} {self.shown_name}"
+            # Names may hold wide characters, so measure in cells, not len()
+            if text_cells(line) > width:
+                line = clip_cells(line, width-3) + "..." if width >= 3 else clip_cells(line, width)
+            self._cached_assign_line = line
+            self._cached_assign_width = width
+        return self._cached_assign_line
 
     def assign_file(self, path):
         if not path:
             return False, "No path provided"
-        if not os.path.exists(path):
+        try:
+            st = os.stat(path)
+        except OSError:
             return False, "File not found"
+        if not stat.S_ISREG(st.st_mode):
+            return False, "Not a regular file"
+
+        file_stat = (st.st_mtime, st.st_size, path)
+        if file_stat == self.file_stat:
+            return True, "cached" # Same unchanged file, keep the decoded sound
         
-        if AUDIO_ENABLED and pygame is not None:
-            try:
-                self.sound = pygame.mixer.Sound(path)
-                self.sound.set_volume(self.volume)
-                logging.info(f"Loaded sound for Channel {self.index}: {path}")
-            except Exception as e:
-                logging.error(f"Error loading sound: {e}")
-                return False, f"Audio Error: {str(e)}"
-        
+        self.file_stat = file_stat
         self.file_path = path
+        self.sound = None
+        self.load_failed = False
+        self.load_error_shown = False
         self.name = os.path.basename(path)
+        if AUDIO_ENABLED and pygame is not None:
+            # Decode in the background instead of stalling the UI on Sound()
+            self.load_pending = path
+            self.audio_q.put((self.index, 'load', path))
         return True, "assigned"
 
-    def assign_key(self, key):
+    def assign_key(self, key, key_map):
+        """Bind key to this channel, updating the shared key -> Channel map."""
+        key_map.pop(self.assigned_key, None)
+        previous = key_map.get(key)
+        if previous is not None and previous is not self:
+            # A key drives one channel; the old owner loses it
+            previous.assigned_key = None
+            previous.assigned_char = "-"
+            logging.info("Channel %d unassigned key %d", previous.index, key)
+        key_map[key] = self
         self.assigned_key = key
-        try:
-            self.assigned_char = chr(key).upper()
-        except ValueError:
-            self.assigned_char = "?"
-        logging.info(f"Channel {self.index} assigned key {key} ({self.assigned_char})")
+        self.assigned_char = key_label(key)
+        logging.info("Channel %d assigned key %d (%s)", self.index, key, self.assigned_char)
 
     def toggle_mode(self):
         if self.is_gated_playing:
             self.is_gated_playing = False
+            self.active_gates.discard(self)
             # self.sound.stop()
 
         modes = list(TriggerMode)
         current_idx = modes.index(self.trigger_mode)
         next_idx = (current_idx + 1) % len(modes)
         self.trigger_mode = modes[next_idx]
-        logging.info(f"Channel {self.index} switched to {self.trigger_mode}")
+        logging.info("Channel %d switched to %s", self.index, self.trigger_mode)
         return self.trigger_mode
     
     def adjust_volume(self, delta):
         self.volume = max(0.0, min(1.0, self.volume + delta))
-        if self.sound:
-            self.sound.set_volume(self.volume)
-        logging.debug(f"Channel {self.index} volume: {self.volume:.2f}")
+        if AUDIO_ENABLED:
+            # Queued even mid-decode: the worker applies it once the sound exists
+            self.audio_q.put((self.index, 'set_volume', self.volume))
+        logging.debug("Channel %d volume: %.2f", self.index, self.volume)
 
-    def trigger(self):
-        if not self.sound:
+    def trigger(self, now_ns):
+        """Queue a trigger; repeats before the next flush_trigger() coalesce.
+
+        now_ns is the loop pass's time.monotonic_ns() reading, kept as the GATE hold time.
+        """
+        if not self.file_path or self.load_failed or not AUDIO_ENABLED:
             return
 
-        now = time.time()
-        logging.debug(f"Triggering Channel {self.index} in {self.trigger_mode}")
+        if self.trigger_mode == TriggerMode.GATE:
+            self.last_triggered_ns = now_ns # Key still held, keep gate open
+        self.pending_trigger = True
+
+    def flush_trigger(self):
+        """Start playback for the trigger queued this tick, if any."""
+        if not self.pending_trigger:
+            return
+        self.pending_trigger = False
+        logging.debug("Triggering Channel %d in %s", self.index, self.trigger_mode)
 
-        ch = None
         if self.trigger_mode == TriggerMode.ONESHOT:
-            ch = self.sound.play()
+            self.voice_pending = True
+            self.audio_q.put((self.index, 'play'))
         
         elif self.trigger_mode == TriggerMode.RETRIGGER:
-            self.sound.stop()
-            ch = self.sound.play()
+            self.voice_pending = True
+            self.audio_q.put((self.index, 'stop'))
+            self.audio_q.put((self.index, 'play'))
 
         elif self.trigger_mode == TriggerMode.GATE:
-            self.last_triggered_time = now
             if not self.is_gated_playing:
-                self.sound.play() 
+                self.audio_q.put((self.index, 'play_gate'))
                 self.is_gated_playing = True
+                self.active_gates.add(self)
                 # Capturing the channel for gate is harder as play() is called once
                 # But we can approximate visualizer for gate easily.
 
-        if ch:
-            self.playing_channels.append(ch)
-
-    def update(self):
-        """Update state, gate logic, and visuals."""
-        # 1. Gate Logic
-        if self.trigger_mode == TriggerMode.GATE and self.is_gated_playing:
-            if time.time() - self.last_triggered_time > GATE_THRESHOLD:
-                if self.sound:
-                    self.sound.stop()
-                self.is_gated_playing = False
-                logging.debug(f"Channel {self.index} Gate Stop")
+    def update_gate(self, now_ns):
+        """Close the gate once the key has been quiet for GATE_THRESHOLD."""
+        if now_ns - self.last_triggered_ns > GATE_THRESHOLD_NS:
+            # sound may still be decoding; the worker runs this after the play
+            self.audio_q.put((self.index, 'stop'))
+            self.is_gated_playing = False
+            self.active_gates.discard(self)
+            logging.debug("Channel %d Gate Stop", self.index)
 
-        # 2. Start Visualizer Logic
+    def update(self, now_ns):
+        """Update visualizer state; now_ns is the loop pass's time.monotonic_ns() reading."""
         is_playing = False
         
-        if self.trigger_mode == TriggerMode.GATE:
+        # Backing slots rather than the properties: this runs for every channel each pass
+        if self._trigger_mode == TriggerMode.GATE:
             is_playing = self.is_gated_playing
         else:
-            # Clean up finished channels
-            self.playing_channels = [ch for ch in self.playing_channels if ch.get_busy()]
-            if self.playing_channels:
+            playing = self.playing_channels
+            # get_busy() takes the SDL audio lock; meter rate is often enough
+            if now_ns - self.busy_polled_ns >= BUSY_POLL_NS:
+                self.busy_polled_ns = now_ns
+                # Voices finish roughly in start order: drop finished ones off the
+                # front, stopping at the first still busy. audio_worker only appends.
+                while playing and not playing[0].get_busy():
+                    playing.popleft()
+            if playing:
                 is_playing = True
 
-        target_level = self.volume if is_playing else 0.0
+        elapsed_ns = now_ns - self.vu_updated_ns
+        self.vu_updated_ns = now_ns
+        vu_level = self.vu_level
+        if not is_playing and vu_level == 0.0:
+            return # Silent and at rest: nothing to smooth
+
+        target_level = self._volume if is_playing else 0.0
         if is_playing:
             # Add some jitter to look like a real meter
-            jitter = random.uniform(0.9, 1.0)
+            jitter = JITTER[Channel._jitter_i]
+            Channel._jitter_i = (Channel._jitter_i + 1) & 0xff
             target_level *= jitter
         
-        # Smooth follow
-        if target_level > self.vu_level:
-            self.vu_level = 0.5 * target_level + 0.5 * self.vu_level # Attack fast
+        # Smooth follow: one-pole filter, fast attack, slow decay. The loop wakes
+        # at an uneven rate, so compound the per-tick coefficient over the time
+        # actually elapsed; the meter then moves at the same speed however often it runs.
+        coeff = VU_ATTACK if target_level > vu_level else VU_DECAY
+        alpha = 1.0 - (1.0 - coeff) ** (elapsed_ns / VU_TICK_NS)
+        vu_level += alpha * (target_level - vu_level)
+        if vu_level < 0.01: vu_level = 0.0
+        self.vu_level = vu_level
+
+def load_sound(ch, path):
+    """Decode path for ch on the audio thread; on failure ch.sound stays None and ch.load_failed is set."""
+    try:
+        sound = pygame.mixer.Sound(path)
+    except Exception as e:
+        logging.error("Error loading sound: %s", e)
+        if ch.file_path == path:
+            ch.load_failed = True # Triggers stop retrying the decode
+            ch.file_stat = None # Let a re-assign of the same path retry
+        return None
+    if ch.file_path == path: # Not reassigned while decoding
+        ch.sound = sound
+        sound.set_volume(ch.volume) # After publishing, so the latest volume wins
+        logging.info("Loaded sound for Channel %d: %s", ch.index, path)
+    return ch.sound
+
+def audio_worker(audio_q, channels):
+    """Run every pygame.mixer call off the UI thread; a None command stops it."""
+    while True:
+        cmd = audio_q.get()
+        if cmd is None:
+            break
+        ch = channels[cmd[0]]
+        action = cmd[1]
+        try:
+            if action == 'load':
+                try:
+                    load_sound(ch, cmd[2])
+                finally:
+                    if ch.load_pending == cmd[2]:
+                        ch.load_pending = None # After load_failed is set, see next_timeout_ms()
+                continue
+
+            sound = ch.sound
+            if sound is None and action in ('play', 'play_gate') and ch.file_path and not ch.load_failed:
+                sound = load_sound(ch, ch.file_path) # First trigger beat the prefetch
+
+            if action == 'play':
+                voice = sound.play() if sound else None
+                if voice:
+                    ch.playing_channels.append(voice)
+            elif sound is None:
+                pass
+            elif action == 'play_gate':
+                sound.play()
+            elif action == 'stop':
+                sound.stop()
+            elif action == 'set_volume':
+                sound.set_volume(cmd[2])
+        except Exception as e:
+            logging.error("Audio command %s failed on Channel %d: %s", action, ch.index, e)
+        finally:
+            if action == 'play':
+                ch.voice_pending = False # After the append, see next_timeout_ms()
+
+def next_timeout_ms(channels, frame_ms=GATE_POLL_MS):
+    """How long getch() may block before a channel needs servicing (-1 = until input).
+
+    frame_ms is the wake interval while anything is playing or a meter is falling.
+    """
+    timeout = -1
+    now_ns = time.monotonic_ns()
+    for ch in channels:
+        if ch.is_gated_playing:
+            # Wake exactly at the gate release, or sooner to keep the meter moving
+            remaining_ms = (GATE_THRESHOLD_NS - (now_ns - ch.last_triggered_ns)) // 1_000_000 + 1
+            wait = max(0, min(frame_ms, remaining_ms))
+        # voice_pending is read first: audio_worker clears it only after appending.
+        # Likewise load_pending before load_failed, so a failed decode is never missed.
+        elif ch.voice_pending or ch.playing_channels or ch.load_pending or ch.vu_level > 0.0:
+            wait = frame_ms
+        elif ch.load_failed and not ch.load_error_shown:
+            wait = 0 # Decode failed since the last pass; report it now
         else:
-            self.vu_level = 0.1 * target_level + 0.9 * self.vu_level # Decay slow
-            
-        if self.vu_level < 0.01: self.vu_level = 0.0
+            continue
+        if timeout < 0 or wait < timeout:
+            timeout = wait
+    return timeout
+
+def init_colors():
+    """Define the colour pairs and precompute every attribute the draw code uses."""
+    global ATTR_GREEN, ATTR_YELLOW, ATTR_RED, ATTR_CYAN, ATTR_MAGENTA, ATTR_BLUE
+    global ATTR_GREEN_BOLD, ATTR_YELLOW_BOLD, ATTR_RED_BOLD
+    global ATTR_CYAN_BOLD, ATTR_MAGENTA_BOLD, ATTR_BLUE_BOLD
+    global ATTR_DIM, ATTR_SELECTED, ATTR_SELECTED_BOLD, ATTR_HEADER_UNDERLINE
+
+    # Define color palette (plain text and blanks use the terminal default, A_NORMAL)
+    curses.init_pair(2, curses.COLOR_GREEN, -1)   # Success / Low Level
+    curses.init_pair(3, curses.COLOR_YELLOW, -1)  # Warning / Mid Level / Selection
+    curses.init_pair(4, curses.COLOR_RED, -1)     # Error / High Level
+    curses.init_pair(5, curses.COLOR_CYAN, -1)    # Headers
+    curses.init_pair(6, curses.COLOR_MAGENTA, -1) # Keys / Accents
+    curses.init_pair(7, curses.COLOR_BLUE, -1)    # Borders / Dim
+
+    ATTR_GREEN = curses.color_pair(2)
+    ATTR_YELLOW = curses.color_pair(3)
+    ATTR_RED = curses.color_pair(4)
+    ATTR_CYAN = curses.color_pair(5)
+    ATTR_MAGENTA = curses.color_pair(6)
+    ATTR_BLUE = curses.color_pair(7)
+    ATTR_GREEN_BOLD = ATTR_GREEN | curses.A_BOLD
+    ATTR_YELLOW_BOLD = ATTR_YELLOW | curses.A_BOLD
+    ATTR_RED_BOLD = ATTR_RED | curses.A_BOLD
+    ATTR_CYAN_BOLD = ATTR_CYAN | curses.A_BOLD
+    ATTR_MAGENTA_BOLD = ATTR_MAGENTA | curses.A_BOLD
+    ATTR_BLUE_BOLD = ATTR_BLUE | curses.A_BOLD
+    ATTR_DIM = ATTR_BLUE | curses.A_DIM # Empty meter cells, fader track
+    ATTR_SELECTED = ATTR_YELLOW | curses.A_REVERSE
+    ATTR_SELECTED_BOLD = ATTR_SELECTED | curses.A_BOLD
+    ATTR_HEADER_UNDERLINE = ATTR_CYAN | curses.A_UNDERLINE
 
 def get_text_input(stdscr, y, x, prompt_text, width=40):
-    curses.echo()
-    curses.curs_set(1)
+    """Read a line after prompt_text with get_wch(), so UTF-8 paths can be typed.
+
+    Enter commits. Left/Right/Home/End move the cursor, Backspace and Delete
+    remove the character before/under it. The caller owns cursor visibility.
+    """
     stdscr.addstr(y, x, prompt_text)
-    stdscr.refresh()
-    
-    stdscr.nodelay(False)
-    input_bytes = stdscr.getstr(y, x + len(prompt_text), width)
-    stdscr.nodelay(True)
-    
-    curses.noecho()
-    curses.curs_set(0)
-    return input_bytes.decode('utf-8').strip()
+    stdscr.noutrefresh() # Goes out with the field's first get_wch() update
+
+    box_x = x + len(prompt_text)
+    # Keep the field's last cell free for the cursor
+    box_width = min(width + 1, stdscr.getmaxyx()[1] - box_x - 1)
+    if box_width < 2:
+        return ""
+    input_win = curses.newwin(1, box_width, y, box_x) # Blocking, unlike stdscr
+    input_win.keypad(True)
+
+    text = ""
+    pos = 0 # Cursor index into text
+    while True:
+        ch = input_win.get_wch()
+        if ch in ('\n', '\r') or ch == curses.KEY_ENTER:
+            break
+        if ch in ('\b', '\x7f') or ch == curses.KEY_BACKSPACE:
+            if pos:
+                text = text[:pos-1] + text[pos:]
+                pos -= 1
+        elif ch == curses.KEY_DC:
+            text = text[:pos] + text[pos+1:]
+        elif ch == curses.KEY_LEFT:
+            pos = max(0, pos - 1)
+        elif ch == curses.KEY_RIGHT:
+            pos = min(len(text), pos + 1)
+        elif ch == curses.KEY_HOME:
+            pos = 0
+        elif ch == curses.KEY_END:
+            pos = len(text)
+        elif isinstance(ch, str) and ch.isprintable() and text_cells(text + ch) < box_width:
+            text = text[:pos] + ch + text[pos:]
+            pos += 1
+        else:
+            continue # Other function keys, resizes, controls, or the field is full
+        input_win.erase()
+        input_win.addstr(0, 0, text)
+        input_win.move(0, text_cells(text[:pos]))
+    return text.strip()
+
+bar_gradients = {} # Bar height -> per-row colour attrs, bottom row first
+
+def bar_gradient(height):
+    """Gradient attrs for a bar of this height, built once per height."""
+    attrs = bar_gradients.get(height)
+    if attrs is None:
+        # Low (bottom) = Green, Mid = Yellow, High = Red
+        attrs = []
+        for i in range(height):
+            pct = i / height
+            if pct < 0.6:
+                attrs.append(ATTR_GREEN)
+            elif pct < 0.85:
+                attrs.append(ATTR_YELLOW)
+            else:
+                attrs.append(ATTR_RED)
+        attrs = bar_gradients[height] = tuple(attrs)
+    return attrs
+
+def draw_vertical_bar(win, x, y_start, height, value, char_fill, char_empty, color_pair=None, prev_value=None):
+    """Generic vertical bar drawer with gradient support.
 
-def draw_vertical_bar(stdscr, x, y_start, height, value, char_fill, char_empty, color_pair=None):
-    """Generic vertical bar drawer with gradient support"""
+    Given prev_value (the value already on screen), only the rows whose fill
+    state differs between the two are drawn.
+    """
     fill_height = int(value * height)
-    for i in range(height):
-        y = y_start + (height - 1) - i
-        
-        # Color Logic (Gradient)
-        # Low (bottom) = Green, Mid = Yellow, High = Red
-        pct = i / height
-        if pct < 0.6:
-            color = curses.color_pair(2) # Green
-        elif pct < 0.85:
-            color = curses.color_pair(3) # Yellow
-        else:
-            color = curses.color_pair(4) # Red
-            
-        if i < fill_height:
-            try:
-                stdscr.addstr(y, x, char_fill, color)
-            except curses.error: pass
-        else:
-            try:
-                stdscr.addstr(y, x, char_empty, curses.color_pair(7) | curses.A_DIM)
-            except curses.error: pass
+    first, last = 0, height
+    if prev_value is not None:
+        prev_height = int(prev_value * height)
+        first, last = min(prev_height, fill_height), max(prev_height, fill_height)
+    attrs = bar_gradient(height)
+    bottom = y_start + height - 1
+    addstr = win.addstr # Bound once for the row loops
+    dim = ATTR_DIM
+
+    # Filled run then empty run, so no per-row fill test or colour pick
+    for i in range(first, min(fill_height, last)):
+        addstr(bottom - i, x, char_fill, attrs[i])
+    for i in range(max(first, fill_height), last):
+        addstr(bottom - i, x, char_empty, dim)
+
+def derive_window(stdscr, nlines, ncols, y, x):
+    """stdscr.derwin(), or None when it wouldn't fit on screen."""
+    height, width = stdscr.getmaxyx()
+    if nlines <= 0 or ncols <= 0 or y < 0 or x < 0 or y + nlines > height or x + ncols > width:
+        return None
+    win = stdscr.derwin(nlines, ncols, y, x)
+    win.leaveok(True) # Cursor is hidden; don't chase it after each update
+    return win
+
+class Layout:
+    """Screen geometry and per-channel subwindows, rebuilt only on a full redraw."""
+    def __init__(self, stdscr):
+        height, width = stdscr.getmaxyx()
+        self.height = height
+        self.width = width
+        self.content_start_y = 2
+
+        # Chrome: title column (None when it doesn't fit), text clip width, status line
+        self.title_x = None
+        if len(FULL_TITLE_STR) < width:
+            self.title_x = (width//2) - (len(FULL_TITLE_STR)//2)
+        self.text_width = max(0, width - 3) # Inside of the border
+        self.status_y = height - 3
+        self.status_blank = " " * max(0, width - 2)
+
+        # Common Column Layout Calculation
+        col_width = (width - 4) // MAX_CHANNELS
+        if col_width > 14: col_width = 14
+        self.col_width = col_width
+        self.start_x = (width - col_width * MAX_CHANNELS) // 2
+        bar_height = height - 10
+        if bar_height < 5: bar_height = 5
+        self.bar_height = bar_height
+        self.start_y = 4
+        self.content_offset = (col_width - 3) // 2
+
+        # Mixer/meter columns: header, key, bar, gap, label, plus a spare bottom
+        # row so nothing is ever written into a window's bottom-right cell.
+        # They must stay clear of the status line, and below 4 columns the
+        # "100%" label no longer fits; in either case draw no columns.
+        self.column_wins = [None] * MAX_CHANNELS
+        if col_width >= 4 and (self.start_y - 2) + bar_height + 5 <= height - 3:
+            for i in range(MAX_CHANNELS):
+                self.column_wins[i] = derive_window(stdscr, bar_height + 5, col_width,
+                                                    self.start_y - 2, self.start_x + i * col_width)
+
+        # Assign rows run from x=4 up to the right border; the last cell stays spare
+        self.row_width = width - 6
+        self.row_wins = [None] * MAX_CHANNELS
+        for i in range(MAX_CHANNELS):
+            y_pos = self.content_start_y + i
+            if y_pos >= height - 2: break
+            self.row_wins[i] = derive_window(stdscr, 1, self.row_width + 1, y_pos, 4)
+
+        # vu_level each meter column currently shows, or None until fully drawn
+        self.meter_levels = [None] * MAX_CHANNELS
 
-def draw_interface(stdscr, mode: Mode, channels, selected_idx, message=""):
+def draw_static(stdscr, layout, mode: Mode):
+    """Border, title, view heading and footer; everything that isn't per-channel."""
     stdscr.erase()
-    height, width = stdscr.getmaxyx()
+    height, width = layout.height, layout.width
 
     # Border
-    stdscr.attron(curses.color_pair(7))
+    stdscr.attron(ATTR_BLUE)
     stdscr.border()
-    stdscr.attroff(curses.color_pair(7))
+    stdscr.attroff(ATTR_BLUE)
 
     # Title
-    title = " tinydaw alpha "
-    if AUDIO_ENABLED:
-        status_text = "(Audio: ON) "
-        status_color = curses.color_pair(2)
-    else:
-        status_text = "(Audio: OFF) "
-        status_color = curses.color_pair(4)
-
-    full_title = title + status_text
-    if len(full_title) < width:
-        start_x = (width//2) - (len(full_title)//2)
-        stdscr.addstr(0, start_x, title, curses.color_pair(6) | curses.A_BOLD)
-        stdscr.addstr(0, start_x + len(title), status_text, status_color | curses.A_BOLD)
-
-    content_start_y = 2
-    
-    # Common Column Layout Calculation
-    col_width = (width - 4) // MAX_CHANNELS
-    if col_width > 14: col_width = 14
-    total_width = col_width * MAX_CHANNELS
-    start_x = (width - total_width) // 2
-    bar_height = height - 10
-    if bar_height < 5: bar_height = 5
-    start_y = 4
-
-    if mode == Mode.VIEW_MIXER:
-        stdscr.addstr(1, 2, "MIXER - Faders (Vol)", curses.color_pair(5) | curses.A_BOLD)
-        
-        for i, ch in enumerate(channels):
-            col_x = start_x + (i * col_width)
-            content_offset = (col_width - 3) // 2
-            draw_x = col_x + content_offset
-            
-            # Header
-            is_sel = (i == selected_idx)
-            header_attr = (curses.color_pair(3) | curses.A_REVERSE) if is_sel else (curses.color_pair(5) | curses.A_BOLD)
-            stdscr.addstr(start_y - 2, draw_x, f"CH{i+1}", header_attr)
-            stdscr.addstr(start_y - 1, draw_x, f"[{ch.assigned_char}]", curses.color_pair(6))
-            
-            # Fader Logic
-            handle_pos = int(ch.volume * (bar_height - 1))
-            for h in range(bar_height):
-                y = start_y + (bar_height - 1) - h
-                char = ' | '
-                attr = curses.color_pair(7) | curses.A_DIM # Track color
-                
-                if h == handle_pos:
-                    char = '[#]' if is_sel else '[=]'
-                    attr = (curses.color_pair(3) | curses.A_REVERSE) if is_sel else (curses.color_pair(3) | curses.A_BOLD)
-                elif h < handle_pos:
-                    char = ' | '
-                    attr = curses.color_pair(7)
-                
-                try: 
-                    stdscr.addstr(y, draw_x, char, attr)
-                except: pass
-
-            name = ch.name
-            if len(name) > col_width - 1: name = name[:col_width - 1]
-            name_x = col_x + max(0, (col_width - len(name)) // 2)
-            stdscr.addstr(start_y + bar_height + 1, name_x, name, curses.color_pair(5))
-
-    elif mode == Mode.VIEW_METERS:
-        stdscr.addstr(1, 2, "METERS - dB Levels (Visual)", curses.color_pair(5) | curses.A_BOLD)
-
-        for i, ch in enumerate(channels):
-            col_x = start_x + (i * col_width)
-            content_offset = (col_width - 3) // 2
-            draw_x = col_x + content_offset
-            
-            # Header
-            stdscr.addstr(start_y - 2, draw_x, f"CH{i+1}", curses.color_pair(5) | curses.A_UNDERLINE)
-            
-            # Meter Logic
-            # Use ASCII blocks with Gradient (handled in draw_vertical_bar)
-            draw_vertical_bar(stdscr, draw_x, start_y, bar_height, ch.vu_level, " █ ", " ░ ", None)
-
-            # Value label
-            try:
-                db_str = f"{int(ch.vu_level * 100)}%"
-                color = curses.color_pair(2)
-                if ch.vu_level > 0.8: color = curses.color_pair(4)
-                elif ch.vu_level > 0.6: color = curses.color_pair(3)
-                stdscr.addstr(start_y + bar_height + 1, draw_x, db_str, color)
-            except: pass
-
-    elif mode == Mode.CHANNEL_ASSIGN:
-        stdscr.addstr(1, 2, "ASSIGN - Setup", curses.color_pair(5) | curses.A_BOLD)
-        
-        for i, ch in enumerate(channels):
-            y_pos = content_start_y + i
-            if y_pos >= height - 2: break
-            
-            prefix = "> " if i == selected_idx else "  "
-            
-            if i == selected_idx:
-                style = curses.color_pair(3) | curses.A_REVERSE | curses.A_BOLD
-            else:
-                style = curses.color_pair(5)
-            
-            line = f"{prefix}CH{i+1}: [{ch.assigned_char}] Vol={int(ch.volume*100)}% {ch.trigger_mode.name} {ch.name}"
-            if len(line) > width - 4: line = line[:width-4] + "..."
-            
-            try:
-                stdscr.addstr(y_pos, 4, line, style)
-            except: pass
-
-    # Message
+    status_attr = ATTR_GREEN_BOLD if AUDIO_ENABLED else ATTR_RED_BOLD
+    start_x = layout.title_x
+    if start_x is not None:
+        stdscr.addstr(0, start_x, TITLE_STR, ATTR_MAGENTA_BOLD)
+        stdscr.addstr(0, start_x + len(TITLE_STR), AUDIO_STATUS_STR, status_attr)
+
+    # Heading + Footer Instructions
+    heading = MODE_HEADINGS[mode]
+    instr = MODE_INSTRUCTIONS[mode]
+
+    # Clip to the inside of the border instead of catching curses.error
+    text_width = layout.text_width
+    if height > 3:
+        stdscr.addstr(1, 2, heading[:text_width], ATTR_CYAN_BOLD)
+        stdscr.addstr(height-2, 2, instr[:text_width], ATTR_BLUE_BOLD)
+
+def draw_message(stdscr, layout, message):
+    """Repaint the status line, clearing whatever message was there before."""
+    y = layout.status_y
+    if y < 1 or layout.width < 4:
+        return
+    stdscr.addstr(y, 1, layout.status_blank)
     if message:
-        try:
-            stdscr.addstr(height-3, 2, f"Use: {message}", curses.color_pair(2) | curses.A_BOLD)
-        except curses.error: pass
-
-    # Footer Instructions
-    instr = ""
-    if mode == Mode.VIEW_MIXER:
-         instr = "[Arrow Keys: Mix] [F2: Meters] [F3: Assign] [Q: Quit]"
-    elif mode == Mode.VIEW_METERS:
-         instr = "[F1: Mixer] [F3: Assign] [Q: Quit]"
-    elif mode == Mode.CHANNEL_ASSIGN:
-        instr = "[Up/Down: Nav] [F: File] [K: Key] [T: Mode] [F1: Mixer]"
+        stdscr.addstr(y, 2, f"Use: {message}"[:layout.text_width], ATTR_GREEN_BOLD)
+
+def meter_label(vu_level):
+    """Percent label and its colour for a meter reading."""
+    color = ATTR_GREEN
+    if vu_level > 0.8: color = ATTR_RED
+    elif vu_level > 0.6: color = ATTR_YELLOW
+    return PERCENT_LABELS[int(vu_level * 100)], color
+
+def meter_stale(layout, ch):
+    """True when ch's meter column would look different if redrawn now."""
+    i = ch.index
+    if layout.column_wins[i] is None:
+        return False
+    shown = layout.meter_levels[i]
+    if shown is None:
+        return True
+    level = ch.vu_level
+    bar_height = layout.bar_height
+    return (int(level * bar_height) != int(shown * bar_height)
+            or meter_label(level) != meter_label(shown))
+
+def update_meter(layout, win, ch):
+    """Patch an already drawn meter column: only changed bar rows and the label."""
+    shown = layout.meter_levels[ch.index]
+    level = ch.vu_level
+    bar_height = layout.bar_height
+    draw_x = layout.content_offset
+    draw_vertical_bar(win, draw_x, 2, bar_height, level, " █ ", " ░ ", None, prev_value=shown)
+
+    label = meter_label(level)
+    if label != meter_label(shown):
+        win.move(bar_height + 3, 0)
+        win.clrtoeol()
+        win.addstr(bar_height + 3, draw_x, *label)
+    layout.meter_levels[ch.index] = level
+
+def draw_mixer_channel(layout, win, ch, selected_idx, full):
+    """Mixer column: header, key label, fader and sample name."""
+    win.erase()
+    bar_height = layout.bar_height
+    draw_x = layout.content_offset
+
+    # Header
+    is_sel = (ch.index == selected_idx)
+    header_attr = ATTR_SELECTED if is_sel else ATTR_CYAN_BOLD
+    header, key_text = ch.render_view_header()
+    win.addstr(0, draw_x, header, header_attr)
+    win.addstr(1, draw_x, key_text, ATTR_MAGENTA)
     
-    try:
-        stdscr.addstr(height-2, 2, instr[:width-3], curses.color_pair(7) | curses.A_BOLD)
-    except curses.error: pass
-
-    stdscr.refresh()
+    # Fader Logic: one vline per track section, then the handle
+    handle_pos = ch.fader_handle_pos(bar_height)
+    handle_y = 2 + (bar_height - 1) - handle_pos
+    above = handle_y - 2
+    handle = '[#]' if is_sel else '[=]'
+    handle_attr = ATTR_SELECTED if is_sel else ATTR_YELLOW_BOLD
+    if above:
+        win.vline(2, draw_x + 1, ord('|') | ATTR_DIM, above) # Track color
+    if handle_pos:
+        win.vline(handle_y + 1, draw_x + 1, ord('|') | ATTR_BLUE, handle_pos)
+    win.addstr(handle_y, draw_x, handle, handle_attr)
+
+    name = ch.shown_name
+    col_width = layout.col_width
+    name = clip_cells(name, col_width - 1)
+    name_x = max(0, (col_width - text_cells(name)) // 2)
+    win.addstr(bar_height + 3, name_x, name, ATTR_CYAN)
+
+def draw_meter_channel(layout, win, ch, selected_idx, full):
+    """Meter column; with full=False one already on screen is patched in place."""
+    i = ch.index
+    if not full and layout.meter_levels[i] is not None:
+        update_meter(layout, win, ch)
+        return
+    win.erase()
+    bar_height = layout.bar_height
+    draw_x = layout.content_offset
+
+    # Header
+    win.addstr(0, draw_x, ch.render_view_header()[0], ATTR_HEADER_UNDERLINE)
+    
+    # Meter Logic
+    # Use ASCII blocks with Gradient (handled in draw_vertical_bar)
+    draw_vertical_bar(win, draw_x, 2, bar_height, ch.vu_level, " █ ", " ░ ", None)
+
+    # Value label
+    db_str, color = meter_label(ch.vu_level)
+    win.addstr(bar_height + 3, draw_x, db_str, color)
+    layout.meter_levels[i] = ch.vu_level
+
+def draw_assign_channel(layout, win, ch, selected_idx, full):
+    """Assign-view row for one channel."""
+    win.erase()
+    prefix = "> " if ch.index == selected_idx else "  "
+    
+    if ch.index == selected_idx:
+        style = ATTR_SELECTED_BOLD
+    else:
+        style = ATTR_CYAN
+    
+    # Narrow terminals can't even fit the prefix; the window's last cell stays spare
+    row_width = layout.row_width
+    line = prefix + ch.render_assign_line(row_width - len(prefix))
+    win.addstr(0, 0, clip_cells(line, row_width), style)
+
+# Per-view channel painters, all called as (layout, win, ch, selected_idx, full)
+CHANNEL_DRAW = {
+    Mode.VIEW_MIXER: draw_mixer_channel,
+    Mode.VIEW_METERS: draw_meter_channel,
+    Mode.CHANNEL_ASSIGN: draw_assign_channel,
+}
+
+def draw_channel(layout, mode: Mode, ch, selected_idx, full=True):
+    """Repaint a single channel's subwindow and stage it with noutrefresh().
+
+    With full=False a meter column that is already on screen is patched in
+    place instead of being erased and redrawn.
+    """
+    if mode == Mode.CHANNEL_ASSIGN:
+        win = layout.row_wins[ch.index]
+    else:
+        win = layout.column_wins[ch.index]
+    if win is None:
+        return # Doesn't fit at this terminal size
+    CHANNEL_DRAW[mode](layout, win, ch, selected_idx, full)
+    win.noutrefresh()
+
+def draw_interface(stdscr, layout, mode: Mode, channels, selected_idx, message=""):
+    """Full repaint, staged for the caller's curses.doupdate()."""
+    draw_static(stdscr, layout, mode)
+    draw_message(stdscr, layout, message)
+    for ch in channels:
+        draw_channel(layout, mode, ch, selected_idx)
+    stdscr.noutrefresh()
 
 def main(stdscr):
     logging.info("Starting tinydaw")
@@ -345,49 +820,70 @@ def main(stdscr):
             pygame.mixer.set_num_channels(32)
             logging.info("Audio initialized")
         except Exception as e:
-            logging.error(f"Audio init failed: {e}")
+            logging.error("Audio init failed: %s", e)
             pass
 
     curses.curs_set(0)
+    # The cursor stays hidden outside the path prompt, so doupdate() may leave
+    # it wherever the last write ended instead of moving it back every frame
+    stdscr.leaveok(True)
     curses.start_color()
     curses.use_default_colors()
-    # Define color palette
-    curses.init_pair(1, curses.COLOR_WHITE, -1)   # Default
-    curses.init_pair(2, curses.COLOR_GREEN, -1)   # Success / Low Level
-    curses.init_pair(3, curses.COLOR_YELLOW, -1)  # Warning / Mid Level / Selection
-    curses.init_pair(4, curses.COLOR_RED, -1)     # Error / High Level
-    curses.init_pair(5, curses.COLOR_CYAN, -1)    # Headers
-    curses.init_pair(6, curses.COLOR_MAGENTA, -1) # Keys / Accents
-    curses.init_pair(7, curses.COLOR_BLUE, -1)    # Borders / Dim
-    
-    stdscr.bkgd(' ', curses.color_pair(1))
-    stdscr.nodelay(True)
+    init_colors()
     
     current_mode = Mode.VIEW_MIXER
-    channels = [Channel(i) for i in range(MAX_CHANNELS)]
+    active_gates = set() # Channels currently holding a GATE open
+    audio_q = queue.SimpleQueue()
+    channels = [Channel(i, active_gates, audio_q) for i in range(MAX_CHANNELS)]
+    key_map = {} # assigned keycode -> Channel
+
+    audio_thread = None
+    if AUDIO_ENABLED:
+        audio_thread = threading.Thread(target=audio_worker, args=(audio_q, channels), daemon=True)
+        audio_thread.start()
     selected_idx = 0
     status_msg = ""
 
-    draw_interface(stdscr, current_mode, channels, selected_idx, status_msg)
+    layout = Layout(stdscr)
+    draw_interface(stdscr, layout, current_mode, channels, selected_idx, status_msg)
+    curses.doupdate()
+    drawn_msg = status_msg
+    dirty = set() # Channel indices to repaint without a full redraw
+    should_redraw = False # Full redraw (mode switch, resize, prompts)
+    last_frame_ns = time.monotonic_ns()
     
-    while True:
+    running = True
+    while running:
         try:
-            time.sleep(0.01) # 100 FPS loop roughly
+            # Sleep until input arrives or the next gate/meter deadline; idle = no wakeups.
+            # Visible meters animate at the frame cap; other views only need gate/voice upkeep.
+            frame_ms = METER_FRAME_MS if current_mode == Mode.VIEW_METERS else GATE_POLL_MS
+            timeout = next_timeout_ms(channels, frame_ms)
+            if should_redraw or dirty or status_msg != drawn_msg:
+                # A frame is held back by the rate cap; wake when it may go out
+                wait = max(0, (last_frame_ns + FRAME_NS - time.monotonic_ns()) // 1_000_000 + 1)
+                if timeout < 0 or wait < timeout:
+                    timeout = wait
+            stdscr.timeout(timeout)
             key = stdscr.getch()
         except KeyboardInterrupt:
             break
-
-        should_redraw = False
         
         # Update channels (Gate + Visuals)
+        now_ns = time.monotonic_ns()
+        for ch in list(active_gates):
+            ch.update_gate(now_ns)
+        in_meters = current_mode == Mode.VIEW_METERS
         for ch in channels:
-            ch.update()
-        
-        # Force redraw in metering mode to animate
-        if current_mode == Mode.VIEW_METERS:
-            should_redraw = True
-
-        if key != -1:
+            if ch.load_failed and not ch.load_error_shown:
+                status_msg = ch.show_load_failure() # Reported by the audio thread
+                dirty.add(ch.index)
+            ch.update(now_ns)
+            # Animate only the meters whose bar or label would visibly move
+            if in_meters and meter_stale(layout, ch):
+                dirty.add(ch.index)
+
+        while key != -1:
             status_msg = "" 
 
             # Mode Switching
@@ -400,67 +896,119 @@ def main(stdscr):
             elif key == curses.KEY_F3:
                 current_mode = Mode.CHANNEL_ASSIGN
                 should_redraw = True
+            elif key == curses.KEY_RESIZE:
+                curses.update_lines_cols()
+                should_redraw = True
             elif key in (ord('q'), ord('Q')):
+                running = False
                 break
             
             # Common Triggering
             if current_mode in (Mode.VIEW_MIXER, Mode.VIEW_METERS):
-                for ch in channels:
-                    if ch.assigned_key == key:
-                        ch.trigger()
+                ch = key_map.get(key)
+                if ch:
+                    ch.trigger(now_ns)
             
             # Mixer Controls
             if current_mode == Mode.VIEW_MIXER:
                 if key == curses.KEY_LEFT:
+                    dirty.add(selected_idx)
                     selected_idx = max(0, selected_idx - 1)
-                    should_redraw = True
+                    dirty.add(selected_idx)
                 elif key == curses.KEY_RIGHT:
+                    dirty.add(selected_idx)
                     selected_idx = min(MAX_CHANNELS - 1, selected_idx + 1)
-                    should_redraw = True
+                    dirty.add(selected_idx)
                 elif key == curses.KEY_UP:
                     channels[selected_idx].adjust_volume(0.05)
-                    should_redraw = True
+                    dirty.add(selected_idx)
                 elif key == curses.KEY_DOWN:
                     channels[selected_idx].adjust_volume(-0.05)
-                    should_redraw = True
+                    dirty.add(selected_idx)
 
             # Assign Controls
             elif current_mode == Mode.CHANNEL_ASSIGN:
                 if key == curses.KEY_UP:
+                    dirty.add(selected_idx)
                     selected_idx = max(0, selected_idx - 1)
-                    should_redraw = True
+                    dirty.add(selected_idx)
                 elif key == curses.KEY_DOWN:
+                    dirty.add(selected_idx)
                     selected_idx = min(MAX_CHANNELS - 1, selected_idx + 1)
-                    should_redraw = True
+                    dirty.add(selected_idx)
                 elif key in (ord('f'), ord('F')):
-                    path = get_text_input(stdscr, stdscr.getmaxyx()[0]-3, 2, "Path: ")
+                    curses.curs_set(1)
+                    path = get_text_input(stdscr, layout.status_y, 2, "Path: ")
+                    curses.curs_set(0)
                     if path:
                         success, msg = channels[selected_idx].assign_file(path)
                         status_msg = msg
                     should_redraw = True
                 elif key in (ord('k'), ord('K')):
                     status_msg = "Press a key to assign..."
-                    stdscr.nodelay(False) 
-                    draw_interface(stdscr, current_mode, channels, selected_idx, status_msg)
-                    new_key = stdscr.getch()
-                    stdscr.nodelay(True) 
+                    stdscr.timeout(-1)
+                    new_key = curses.KEY_RESIZE
+                    while new_key == curses.KEY_RESIZE:
+                        # A resize is not a key choice: re-lay-out, re-prompt and keep waiting
+                        if stdscr.getmaxyx() != (layout.height, layout.width):
+                            curses.update_lines_cols()
+                            layout = Layout(stdscr)
+                        draw_interface(stdscr, layout, current_mode, channels, selected_idx, status_msg)
+                        curses.doupdate()
+                        new_key = stdscr.getch()
                     if new_key not in (curses.KEY_F1, curses.KEY_F2, curses.KEY_F3, 27): 
-                        channels[selected_idx].assign_key(new_key)
-                        status_msg = f"Key assigned"
+                        channels[selected_idx].assign_key(new_key, key_map)
+                        status_msg = "Key assigned"
                     else:
                         status_msg = "Cancelled"
                     should_redraw = True
                 elif key in (ord('t'), ord('T')):
                     new_mode = channels[selected_idx].toggle_mode()
                     status_msg = f"Mode: {new_mode.name}"
-                    should_redraw = True
+                    dirty.add(selected_idx)
+
+            # Handle anything else already queued in the same pass
+            stdscr.timeout(0)
+            key = stdscr.getch()
+
+        # Play this pass's triggers in one go (key repeats coalesce)
+        for ch in channels:
+            ch.flush_trigger()
 
+        # Changes accumulate across passes; at most one screen update per frame
+        frame_ns = time.monotonic_ns() # Prompts above may have blocked; take a fresh reading
+        if frame_ns - last_frame_ns < FRAME_NS:
+            continue
         if should_redraw:
-            draw_interface(stdscr, current_mode, channels, selected_idx, status_msg)
+            should_redraw = False
+            last_frame_ns = frame_ns
+            if stdscr.getmaxyx() != (layout.height, layout.width):
+                layout = Layout(stdscr) # Rebuild subwindows only on an actual resize
+            draw_interface(stdscr, layout, current_mode, channels, selected_idx, status_msg)
+            drawn_msg = status_msg
+            dirty.clear()
+            curses.doupdate()
+        elif dirty or status_msg != drawn_msg:
+            last_frame_ns = frame_ns
+            for i in dirty:
+                draw_channel(layout, current_mode, channels[i], selected_idx, full=False)
+            dirty.clear()
+            if status_msg != drawn_msg:
+                draw_message(stdscr, layout, status_msg)
+                stdscr.noutrefresh()
+                drawn_msg = status_msg
+            curses.doupdate()
+
+    if audio_thread is not None:
+        audio_q.put(None)
+        audio_thread.join(timeout=1.0)
 
 if __name__ == "__main__":
+    log_listener.start()
     try:
         wrapper(main)
     except Exception as e:
-        logging.critical(f"Crash: {e}", exc_info=True)
+        logging.critical("Crash: %s", e, exc_info=True)
         print(f"Error: {e}")
+    finally:
+        log_listener.stop()